@@ -6,50 +6,380 @@ PDF Stitcher - A simple tool to combine multiple PDF files into one.
 import os
 import sys
 import glob
+import queue
+import threading
+from fnmatch import fnmatch
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 import click
-from pypdf import PdfWriter, PdfReader
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import letter
+from pypdf import PageObject, PdfWriter, PdfReader
+from pypdf.generic import (
+    DecodedStreamObject,
+    DictionaryObject,
+    IndirectObject,
+    NameObject,
+    read_object,
+)
 from io import BytesIO
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 
+try:
+    import pikepdf
+except ImportError:
+    pikepdf = None
 
-def create_source_page(filename: str) -> bytes:
+try:
+    import pymupdf
+except ImportError:
+    pymupdf = None
+
+
+# Supported PDF libraries for the merge itself
+BACKENDS = ("pypdf", "pikepdf", "pymupdf")
+
+SOURCE_PAGE_SIZE = (612, 792)  # US Letter
+SOURCE_FONT = "/Helvetica-Bold"
+SOURCE_FONT_SIZE = 16
+SOURCE_LABEL = "Source: "
+
+# Files larger than this are parsed straight from disk instead of being
+# read into memory first
+MAX_PREREAD_SIZE = 256 * 1024 * 1024
+
+# ProcessPoolExecutor refuses more workers than this on Windows
+MAX_POOL_WORKERS = 61
+
+# Number of files read ahead of the parser when stitching without --jobs
+PREFETCH_QUEUE_SIZE = 4
+
+PDF_WHITESPACE = (b" ", b"\t", b"\n", b"\r", b"\f", b"\x00")
+
+
+def create_source_page_content(source_name: str) -> bytes:
     """
-    Create a simple PDF page showing the source filename.
+    Create the content stream for a page showing the source filename.
     
     Args:
-        filename: The name of the source file
+        source_name: The source file's name, without its directory
         
     Returns:
-        bytes: PDF data for the source page
+        bytes: Content stream drawing the filename and a separator line
     """
-    buffer = BytesIO()
-    c = canvas.Canvas(buffer, pagesize=letter)
+    text = f"{SOURCE_LABEL}{source_name}"
+    text = text.encode("cp1252", errors="replace")
+    text = text.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)")
     
-    # Add title and filename text
-    c.setFont("Helvetica-Bold", 16)
-    c.drawString(72, 720, f"Source: {os.path.basename(filename)}")
+    return (
+        # Add title and filename text
+        b"BT /F1 %d Tf 72 720 Td (" % SOURCE_FONT_SIZE + text + b") Tj ET\n"
+        # Add a simple line separator
+        b"72 710 m 540 710 l S\n"
+    )
+
+
+class _CachingReader(PdfReader):
+    """
+    PdfReader that indexes each object stream the first time it is touched.
     
-    # Add a simple line separator
-    c.line(72, 710, 540, 710)
+    pypdf re-decodes and re-scans an object stream's header for every object
+    it resolves from it, which is quadratic for files that pack thousands of
+    objects into one stream. This reader keeps the decoded data and an
+    {object number: offset} table per stream, then seeks straight to the object.
+    """
     
-    c.showPage()
-    c.save()
+    def __init__(self, *args, **kwargs):
+        self._objstm_cache = {}
+        super().__init__(*args, **kwargs)
     
-    buffer.seek(0)
-    return buffer.getvalue()
+    def _get_objstm_index(self, stmnum: int) -> tuple:
+        """Decode an object stream once and cache its data and offset table."""
+        index = self._objstm_cache.get(stmnum)
+        if index is None:
+            obj_stm = IndirectObject(stmnum, 0, self).get_object()
+            data = obj_stm.get_data()
+            first = int(obj_stm["/First"])
+            header = data[:first].split()[:2 * int(obj_stm["/N"])]
+            offsets = {
+                int(header[i]): first + int(header[i + 1])
+                for i in range(0, len(header) - 1, 2)
+            }
+            index = self._objstm_cache[stmnum] = (data, offsets)
+        return index
+    
+    def _get_object_from_stream(self, indirect_reference: IndirectObject):
+        stmnum, _ = self.xref_objStm[indirect_reference.idnum]
+        try:
+            data, offsets = self._get_objstm_index(stmnum)
+            position = offsets[indirect_reference.idnum]
+            
+            # Skip whitespace in case the offset points just before the object
+            while data[position:position + 1] in PDF_WHITESPACE:
+                position += 1
+            
+            stream_data = BytesIO(data)
+            stream_data.seek(position)
+            return read_object(stream_data, self)
+        except Exception:
+            # Let pypdf handle malformed streams with its usual warnings
+            return super()._get_object_from_stream(indirect_reference)
+
+
+class EncryptedPDFError(Exception):
+    """Raised when an input PDF is encrypted and cannot be stitched."""
 
 
 class PDFStitcher:
     """A class to handle PDF stitching operations."""
     
-    def __init__(self, include_source: bool = True):
-        self.writer = PdfWriter()
+    __slots__ = (
+        'backend',
+        'writer',
+        'processed_files',
+        'failed_files',
+        'include_source',
+        'verbose',
+        '_processed_count',
+        '_failed_count',
+        '_page_count',
+        '_source_resources',
+        '_sources',
+        '_status_messages',
+    )
+    
+    def __init__(self, include_source: bool = True, backend: str = "pypdf", verbose: bool = False):
+        """
+        Create a stitcher.
+        
+        Args:
+            include_source: Whether to add a source filename page before each PDF
+            backend: PDF library to use (see BACKENDS)
+            verbose: Collect a status message for every added file. Messages
+                are buffered, so callers must call flush_status() to print them
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend '{backend}' (expected one of: {', '.join(BACKENDS)})")
+        if backend == "pikepdf" and pikepdf is None:
+            raise ImportError("The pikepdf backend requires the 'pikepdf' package")
+        if backend == "pymupdf" and pymupdf is None:
+            raise ImportError("The pymupdf backend requires the 'pymupdf' package")
+        
+        self.backend = backend
+        if backend == "pikepdf":
+            self.writer = pikepdf.Pdf.new()
+        elif backend == "pymupdf":
+            self.writer = pymupdf.open()
+        else:
+            self.writer = PdfWriter()
         self.processed_files = []
         self.failed_files = []
+        self._processed_count = 0
+        self._failed_count = 0
+        self._page_count = 0
         self.include_source = include_source
+        self.verbose = verbose
+        # Per-file success messages, printed in one go by flush_status()
+        self._status_messages = []
+        self._source_resources = None
+        # pikepdf copies page data lazily, so sources stay open until saved;
+        # _append_pdf opens them from memory to avoid holding file descriptors
+        self._sources = []
+    
+    def _open_pdf(self, pdf_path: str, source):
+        """
+        Open a PDF with the configured backend.
+        
+        Args:
+            pdf_path: Path to the original PDF file (used for error reporting)
+            source: Path, binary file object or BytesIO holding the PDF
+            
+        Returns:
+            The backend's document object (PdfReader, pikepdf.Pdf or pymupdf.Document)
+            
+        Raises:
+            EncryptedPDFError: If the PDF is encrypted
+        """
+        if self.backend == "pikepdf":
+            try:
+                document = pikepdf.open(source)
+            except pikepdf.PasswordError:
+                raise EncryptedPDFError(pdf_path)
+            
+            if document.is_encrypted:
+                document.close()
+                raise EncryptedPDFError(pdf_path)
+            self._sources.append(document)
+            return document
+        elif self.backend == "pymupdf":
+            if isinstance(source, BytesIO):
+                document = pymupdf.open(stream=source.getvalue(), filetype="pdf")
+            else:
+                document = pymupdf.open(source)
+            
+            # PyMuPDF silently decrypts files with an empty user password
+            if document.needs_pass or document.metadata.get("encryption"):
+                document.close()
+                raise EncryptedPDFError(pdf_path)
+            return document
+        else:
+            document = _CachingReader(source, strict=False)
+        
+        # Check if PDF is encrypted before adding anything. This only needs
+        # the trailer, so skipped files never load their page tree
+        if document.is_encrypted:
+            raise EncryptedPDFError(pdf_path)
+        return document
+    
+    def _append_pdf(self, pdf_path: str) -> int:
+        """
+        Append a PDF file (and its source page, if enabled) to the writer.
+        
+        Files up to MAX_PREREAD_SIZE are read into memory in one go so that
+        pypdf's xref and object stream seeks hit RAM instead of the disk, and
+        pikepdf sources kept until saving do not each hold a file descriptor.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            
+        Returns:
+            int: Number of content pages added (excluding the source page)
+            
+        Raises:
+            EncryptedPDFError: If the PDF is encrypted
+        """
+        if self.backend == "pymupdf":
+            # PyMuPDF copies pages eagerly and closes the source right away
+            return self._append_document(pdf_path, self._open_pdf(pdf_path, pdf_path))
+        
+        if os.path.getsize(pdf_path) > MAX_PREREAD_SIZE:
+            if self.backend == "pikepdf":
+                # pikepdf reads page data lazily, so this file stays open until saved
+                return self._append_document(pdf_path, self._open_pdf(pdf_path, pdf_path))
+            
+            # Avoid holding very large files in memory twice
+            with open(pdf_path, 'rb') as file:
+                return self._append_document(pdf_path, self._open_pdf(pdf_path, file))
+        
+        data = BytesIO(Path(pdf_path).read_bytes())
+        return self._append_document(pdf_path, self._open_pdf(pdf_path, data))
+    
+    def _append_document(self, pdf_path: str, document, include_source: Optional[bool] = None) -> int:
+        """
+        Append the pages of an opened PDF (and its source page, if enabled).
+        
+        Args:
+            pdf_path: Path to the original PDF file
+            document: Document returned by _open_pdf
+            include_source: Override for whether to add a source page
+            
+        Returns:
+            int: Number of pages added from the document (excluding the source page)
+        """
+        if include_source is None:
+            include_source = self.include_source
+        writer = self.writer
+        backend = self.backend
+        
+        # Pages from earlier files are tracked by the running counter, which
+        # matches the writer's length because nothing is added on failure
+        position = self._page_count
+        
+        if backend == "pymupdf":
+            try:
+                num_pages = document.page_count
+                writer.insert_pdf(document)
+            finally:
+                document.close()
+        elif backend == "pikepdf":
+            num_pages = len(document.pages)
+            writer.pages.extend(document.pages)
+        else:
+            num_pages = len(document.pages)
+            # Add all pages from the PDF in one batch so pypdf can reuse
+            # objects it has already resolved from this file
+            writer.append(document, import_outline=False)
+        
+        # Add source page if enabled. It goes in only once the file's pages
+        # are in, so a file that fails part-way leaves no orphan source page
+        if include_source:
+            self._add_source_page(os.path.basename(pdf_path), position)
+        
+        return num_pages
+    
+    def _add_source_page(self, source_name: str, index: int) -> None:
+        """
+        Insert a page showing the source filename directly into the writer.
+        
+        Args:
+            source_name: The source file's name, without its directory
+            index: Position of the new page in the writer
+        """
+        writer = self.writer
+        
+        if self.backend == "pymupdf":
+            # PyMuPDF places text from the top-left corner
+            width, height = SOURCE_PAGE_SIZE
+            page = writer.new_page(pno=index, width=width, height=height)
+            page.insert_text((72, height - 720), f"{SOURCE_LABEL}{source_name}",
+                             fontname="hebo", fontsize=SOURCE_FONT_SIZE)
+            page.draw_line((72, height - 710), (540, height - 710))
+            return
+        
+        content = create_source_page_content(source_name)
+        
+        if self.backend == "pikepdf":
+            # All source pages share one font resource dictionary
+            if self._source_resources is None:
+                font = pikepdf.Dictionary(
+                    Type=pikepdf.Name.Font,
+                    Subtype=pikepdf.Name.Type1,
+                    BaseFont=pikepdf.Name(SOURCE_FONT),
+                    Encoding=pikepdf.Name.WinAnsiEncoding,
+                )
+                self._source_resources = writer.make_indirect(pikepdf.Dictionary(
+                    Font=pikepdf.Dictionary(F1=writer.make_indirect(font)),
+                ))
+            
+            page = pikepdf.Dictionary(
+                Type=pikepdf.Name.Page,
+                MediaBox=[0, 0, *SOURCE_PAGE_SIZE],
+                Resources=self._source_resources,
+                Contents=writer.make_stream(content),
+            )
+            writer.pages.insert(index, pikepdf.Page(page))
+            return
+        
+        # All source pages share one font resource dictionary
+        if self._source_resources is None:
+            font = DictionaryObject({
+                NameObject("/Type"): NameObject("/Font"),
+                NameObject("/Subtype"): NameObject("/Type1"),
+                NameObject("/BaseFont"): NameObject(SOURCE_FONT),
+                NameObject("/Encoding"): NameObject("/WinAnsiEncoding"),
+            })
+            self._source_resources = writer._add_object(DictionaryObject({
+                NameObject("/Font"): DictionaryObject({
+                    NameObject("/F1"): writer._add_object(font),
+                }),
+            }))
+        
+        stream = DecodedStreamObject()
+        stream.set_data(content)
+        
+        page = writer.insert_page(PageObject.create_blank_page(writer, *SOURCE_PAGE_SIZE), index)
+        page[NameObject("/Resources")] = self._source_resources
+        page[NameObject("/Contents")] = writer._add_object(stream)
+    
+    def _serialize(self) -> BytesIO:
+        """Write the stitched PDF into an in-memory buffer."""
+        buffer = BytesIO()
+        if self.backend == "pikepdf":
+            self.writer.save(buffer, linearize=False)
+        elif self.backend == "pymupdf":
+            buffer.write(self.writer.tobytes(garbage=3, deflate=True))
+        else:
+            self.writer.write(buffer)
+        return buffer
     
     def add_pdf(self, pdf_path: str) -> bool:
         """
@@ -62,39 +392,87 @@ class PDFStitcher:
             bool: True if successfully added, False otherwise
         """
         try:
-            # Add source page if enabled
-            if self.include_source:
-                source_pdf_data = create_source_page(pdf_path)
-                source_buffer = BytesIO(source_pdf_data)
-                source_reader = PdfReader(source_buffer)
-                
-                # Add the source page
-                for page in source_reader.pages:
-                    self.writer.add_page(page)
-            
-            # Add the actual PDF content
-            with open(pdf_path, 'rb') as file:
-                reader = PdfReader(file)
-                
-                # Check if PDF is encrypted
-                if reader.is_encrypted:
-                    click.echo(f"⚠️  Warning: '{pdf_path}' is encrypted and will be skipped")
-                    self.failed_files.append(pdf_path)
-                    return False
-                
-                # Add all pages from the PDF
-                for page in reader.pages:
-                    self.writer.add_page(page)
-                
-                self.processed_files.append(pdf_path)
-                source_info = " (with source page)" if self.include_source else ""
-                click.echo(f"✅ Added: {os.path.basename(pdf_path)} ({len(reader.pages)} pages{source_info})")
-                return True
-                
+            num_pages = self._append_pdf(pdf_path)
         except Exception as e:
-            click.echo(f"❌ Error processing '{pdf_path}': {str(e)}")
-            self.failed_files.append(pdf_path)
+            self.record_failure(pdf_path, e)
             return False
+        
+        self._record_success(pdf_path, num_pages)
+        return True
+    
+    def add_pdf_from_bytes(self, pdf_path: str, data: bytes) -> bool:
+        """
+        Add a PDF whose contents have already been read from disk.
+        
+        Args:
+            pdf_path: Path to the PDF file (used for reporting and the source page)
+            data: Raw contents of the PDF file
+            
+        Returns:
+            bool: True if successfully added, False otherwise
+        """
+        try:
+            document = self._open_pdf(pdf_path, BytesIO(data))
+            num_pages = self._append_document(pdf_path, document)
+        except Exception as e:
+            self.record_failure(pdf_path, e)
+            return False
+        
+        self._record_success(pdf_path, num_pages)
+        return True
+    
+    def add_parsed_pdf(self, pdf_path: str, data: bytes) -> bool:
+        """
+        Add a PDF that was already parsed and serialized by a worker process.
+        
+        Args:
+            pdf_path: Path to the original PDF file
+            data: Serialized PDF bytes as returned by _parse_one
+            
+        Returns:
+            bool: True if successfully added, False otherwise
+        """
+        try:
+            document = self._open_pdf(pdf_path, BytesIO(data))
+            num_pages = self._append_document(pdf_path, document, include_source=False)
+        except Exception as e:
+            self.record_failure(pdf_path, e)
+            return False
+        
+        # The worker already added the source page
+        num_pages -= 1 if self.include_source else 0
+        self._record_success(pdf_path, num_pages)
+        return True
+    
+    def record_failure(self, pdf_path: str, error: Exception) -> None:
+        """
+        Record a file that could not be added and report why.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            error: The exception raised while processing the file
+        """
+        if isinstance(error, EncryptedPDFError):
+            click.echo(f"⚠️  Warning: '{pdf_path}' is encrypted and will be skipped")
+        else:
+            click.echo(f"❌ Error processing '{pdf_path}': {str(error)}")
+        self.failed_files.append(pdf_path)
+        self._failed_count += 1
+    
+    def _record_success(self, pdf_path: str, num_pages: int) -> None:
+        """Record a successfully added file and report it."""
+        self.processed_files.append(pdf_path)
+        self._processed_count += 1
+        self._page_count += num_pages + (1 if self.include_source else 0)
+        if self.verbose:
+            source_info = " (with source page)" if self.include_source else ""
+            self._status_messages.append(f"✅ Added: {os.path.basename(pdf_path)} ({num_pages} pages{source_info})")
+    
+    def flush_status(self) -> None:
+        """Print the buffered per-file status messages (verbose mode only)."""
+        if self._status_messages:
+            click.echo("\n".join(self._status_messages))
+            self._status_messages.clear()
     
     def save_stitched_pdf(self, output_path: str) -> bool:
         """
@@ -107,8 +485,19 @@ class PDFStitcher:
             bool: True if successfully saved, False otherwise
         """
         try:
-            with open(output_path, 'wb') as output_file:
-                self.writer.write(output_file)
+            # Serialize in memory so the file is written in one go rather
+            # than through pypdf's many small write() calls
+            buffer = self._serialize()
+            
+            flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+            fd = os.open(output_path, flags, 0o666)
+            try:
+                with buffer.getbuffer() as data:
+                    written = 0
+                    while written < len(data):
+                        written += os.write(fd, data[written:])
+            finally:
+                os.close(fd)
             return True
         except Exception as e:
             click.echo(f"❌ Error saving stitched PDF: {str(e)}")
@@ -117,12 +506,103 @@ class PDFStitcher:
     def get_stats(self) -> dict:
         """Get statistics about the stitching operation."""
         return {
-            'processed': len(self.processed_files),
-            'failed': len(self.failed_files),
-            'total_pages': len(self.writer.pages)
+            'processed': self._processed_count,
+            'failed': self._failed_count,
+            'total_pages': self._page_count
         }
 
 
+def _parse_one(pdf_path: str, include_source: bool, backend: str = "pypdf") -> bytes:
+    """
+    Parse a single PDF in a worker process.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        include_source: Whether to prepend a source filename page
+        backend: PDF library to use (see BACKENDS)
+        
+    Returns:
+        bytes: Serialized PDF holding the source page (if enabled) and all pages
+        
+    Raises:
+        EncryptedPDFError: If the PDF is encrypted
+    """
+    stitcher = PDFStitcher(include_source=include_source, backend=backend)
+    stitcher._append_pdf(pdf_path)
+    return stitcher._serialize().getvalue()
+
+
+def parse_in_pool(pdf_paths: List[str], include_source: bool, backend: str,
+                  max_workers: int) -> Iterator[Tuple[str, Optional[Future]]]:
+    """
+    Parse PDF files on a process pool, yielding their futures in input order.
+    
+    At most 2 * max_workers files are in flight at once, so finished results
+    are not all held in memory until the end of the batch.
+    
+    Args:
+        pdf_paths: Paths of the PDF files, in the order they should be yielded
+        include_source: Whether workers should prepend a source filename page
+        backend: PDF library to use (see BACKENDS)
+        max_workers: Number of worker processes
+        
+    Yields:
+        (path, future) pairs; future resolves to the bytes from _parse_one, or
+        is None for files over MAX_PREREAD_SIZE, which the caller should add
+        with add_pdf rather than ship back from a worker
+    """
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque()
+        for pdf_path in pdf_paths:
+            try:
+                too_large = os.path.getsize(pdf_path) > MAX_PREREAD_SIZE
+            except OSError:
+                too_large = False  # let the worker report the error
+            
+            future = None if too_large else executor.submit(_parse_one, pdf_path, include_source, backend)
+            pending.append((pdf_path, future))
+            if len(pending) >= 2 * max_workers:
+                yield pending.popleft()
+        
+        while pending:
+            yield pending.popleft()
+
+
+def prefetch_pdfs(pdf_paths: List[str], maxsize: int = PREFETCH_QUEUE_SIZE) -> Iterator[Tuple[str, Optional[bytes]]]:
+    """
+    Read PDF files ahead of the consumer on a background thread.
+    
+    Args:
+        pdf_paths: Paths of the PDF files, in the order they should be yielded
+        maxsize: Maximum number of files held in memory ahead of the consumer
+        
+    Yields:
+        (path, data) pairs; data is None for files that are too large to
+        prefetch or could not be read, so the caller can fall back to add_pdf
+    """
+    file_queue = queue.Queue(maxsize=maxsize)
+    
+    def read_files():
+        for pdf_path in pdf_paths:
+            try:
+                if os.path.getsize(pdf_path) > MAX_PREREAD_SIZE:
+                    data = None
+                else:
+                    data = Path(pdf_path).read_bytes()
+            except OSError:
+                data = None
+            file_queue.put((pdf_path, data))
+        file_queue.put(None)
+    
+    threading.Thread(target=read_files, daemon=True).start()
+    
+    while True:
+        item = file_queue.get()
+        if item is None:
+            return
+        yield item
+
+
 def find_pdf_files(directory: str, pattern: str = "*.pdf") -> List[str]:
     """
     Find all PDF files in a directory.
@@ -134,9 +614,26 @@ def find_pdf_files(directory: str, pattern: str = "*.pdf") -> List[str]:
     Returns:
         List of PDF file paths sorted alphabetically
     """
-    search_path = os.path.join(directory, pattern)
-    pdf_files = glob.glob(search_path)
-    return sorted(pdf_files)
+    if '/' in pattern or os.sep in pattern:
+        # Patterns with a directory part need glob's path matching
+        search_path = os.path.join(directory, pattern)
+        return sorted(path for path in glob.glob(search_path) if os.path.isfile(path))
+    
+    # scandir gets the file type from the directory entry itself, so only
+    # symlinks need an extra stat call
+    with os.scandir(directory) as entries:
+        return sorted(
+            entry.path for entry in entries
+            if fnmatch(entry.name, pattern)
+            # Match glob's behaviour of skipping hidden files
+            and (not entry.name.startswith('.') or pattern.startswith('.'))
+            and entry.is_file()
+        )
+
+
+def _show_progress_item(item: Optional[tuple]) -> Optional[str]:
+    """Show the current file's name next to the progress bar."""
+    return os.path.basename(item[0]) if item else None
 
 
 @click.command()
@@ -149,10 +646,15 @@ def find_pdf_files(directory: str, pattern: str = "*.pdf") -> List[str]:
 @click.option('--pattern', '-p', default='*.pdf',
               help='File pattern to match in input directory (default: *.pdf)')
 @click.option('--verbose', '-v', is_flag=True,
-              help='Enable verbose output')
+              help='Enable verbose output (lists every added file after processing)')
 @click.option('--no_source', is_flag=True,
               help='Disable adding source filename to the PDF content (default: source filenames are included)')
-def main(input_dir: Optional[str], files: tuple, output: str, pattern: str, verbose: bool, no_source: bool):
+@click.option('--backend', type=click.Choice(BACKENDS), default='pypdf',
+              help='PDF library used for merging (default: pypdf; pikepdf and pymupdf are faster but must be installed separately)')
+@click.option('--jobs', '-j', type=click.IntRange(min=1), default=1,
+              help='Worker processes for parsing with the pikepdf/pymupdf backends (default: 1)')
+def main(input_dir: Optional[str], files: tuple, output: str, pattern: str, verbose: bool, no_source: bool,
+         backend: str, jobs: int):
     """
     PDF Stitcher - Combine multiple PDF files into a single document.
     
@@ -177,6 +679,15 @@ def main(input_dir: Optional[str], files: tuple, output: str, pattern: str, verb
         # Use specific files provided
         pdf_files = list(files)
         click.echo(f"📁 Processing {len(pdf_files)} specified files...")
+        
+        # Validate that all files exist; stat them concurrently since each
+        # check can be a round-trip on network filesystems
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            exists = list(executor.map(os.path.isfile, pdf_files))
+        for pdf_file, is_file in zip(pdf_files, exists):
+            if not is_file:
+                click.echo(f"❌ Error: File '{pdf_file}' does not exist")
+                sys.exit(1)
     elif input_dir:
         # Find PDFs in directory
         if not os.path.isdir(input_dir):
@@ -195,12 +706,6 @@ def main(input_dir: Optional[str], files: tuple, output: str, pattern: str, verb
         click.echo("❌ No PDF files found to process")
         sys.exit(1)
     
-    # Validate that all files exist
-    for pdf_file in pdf_files:
-        if not os.path.isfile(pdf_file):
-            click.echo(f"❌ Error: File '{pdf_file}' does not exist")
-            sys.exit(1)
-    
     if verbose:
         click.echo("\n📋 Files to process:")
         for i, pdf_file in enumerate(pdf_files, 1):
@@ -208,12 +713,46 @@ def main(input_dir: Optional[str], files: tuple, output: str, pattern: str, verb
         click.echo()
     
     # Create stitcher and process files
-    stitcher = PDFStitcher(include_source=not no_source)
+    try:
+        stitcher = PDFStitcher(include_source=not no_source, backend=backend, verbose=verbose)
+    except ImportError as e:
+        click.echo(f"❌ Error: {str(e)}")
+        sys.exit(1)
+    
+    if jobs > 1 and backend == "pypdf":
+        # Re-parsing worker output in the parent costs as much as parsing the
+        # inputs directly, so pypdf gains nothing from a process pool
+        click.echo("⚠️  Warning: --jobs is ignored with the pypdf backend")
+        jobs = 1
     
     click.echo("🔄 Processing PDF files...")
-    with click.progressbar(pdf_files, label='Stitching PDFs') as bar:
-        for pdf_file in bar:
-            stitcher.add_pdf(pdf_file)
+    max_workers = min(jobs, len(pdf_files), MAX_POOL_WORKERS)
+    if max_workers > 1:
+        # Merge in input order; a broken PDF only fails its own future
+        with click.progressbar(parse_in_pool(pdf_files, not no_source, backend, max_workers),
+                               length=len(pdf_files), label='Stitching PDFs',
+                               item_show_func=_show_progress_item) as bar:
+            for pdf_file, future in bar:
+                if future is None:
+                    stitcher.add_pdf(pdf_file)
+                    continue
+                try:
+                    data = future.result()
+                except Exception as e:
+                    stitcher.record_failure(pdf_file, e)
+                    continue
+                stitcher.add_parsed_pdf(pdf_file, data)
+    else:
+        # Default path: overlap reading the next file with parsing this one
+        with click.progressbar(prefetch_pdfs(pdf_files), length=len(pdf_files),
+                               label='Stitching PDFs', item_show_func=_show_progress_item) as bar:
+            for pdf_file, data in bar:
+                if data is None:
+                    stitcher.add_pdf(pdf_file)
+                else:
+                    stitcher.add_pdf_from_bytes(pdf_file, data)
+    
+    stitcher.flush_status()
     
     # Save the result
     click.echo(f"\n💾 Saving stitched PDF as '{output}'...")